@@ -1,25 +1,57 @@
-from .trakt_hub import TraktHub, TraktHubViewer
+from importlib import import_module
+
 from .trakt_utils.parsers import APIParser, ConfigFileParser, _metadata_parser
-from .trakt_functions import (
-    get_anticipated,
-    get_popular,
-    get_trending,
-    is_anticipated,
-    is_popular,
-    is_trending,
-    trakt_query,
-)
 
 
-# pyproject.toml
-_pyproject = _metadata_parser()
+# Submodules are only imported once one of their attributes is accessed.
+_LAZY_IMPORTS = {
+    "TraktHub": ".trakt_hub",
+    "TraktHubViewer": ".trakt_hub",
+    "aget_anticipated": ".trakt_functions",
+    "aget_popular": ".trakt_functions",
+    "aget_trending": ".trakt_functions",
+    "are_anticipated": ".trakt_functions",
+    "are_popular": ".trakt_functions",
+    "are_trending": ".trakt_functions",
+    "get_anticipated": ".trakt_functions",
+    "get_popular": ".trakt_functions",
+    "get_trending": ".trakt_functions",
+    "is_anticipated": ".trakt_functions",
+    "is_popular": ".trakt_functions",
+    "is_trending": ".trakt_functions",
+    "trakt_query": ".trakt_functions",
+}
+
 
-# Package Metadata
-__license__ = f"{_pyproject['license']}, Version 2.0"
-__version__, __author__, __summary__, __url__ = (
-    _pyproject.get(k) for k in ("version", "author", "description", "url")
+_METADATA_ATTRS = (
+    "__license__",
+    "__version__",
+    "__author__",
+    "__summary__",
+    "__url__",
+    "__copyright__",
 )
-__copyright__ = f"Copyright © 2024, {__author__}"
+
+
+def __getattr__(name):
+    # Package Metadata (pyproject.toml is only parsed on first access)
+    if name in _METADATA_ATTRS:
+        _pyproject = _metadata_parser()
+        _metadata = {
+            "__license__": f"{_pyproject['license']}, Version 2.0",
+            "__version__": _pyproject.get("version"),
+            "__author__": _pyproject.get("author"),
+            "__summary__": _pyproject.get("description"),
+            "__url__": _pyproject.get("url"),
+            "__copyright__": f"Copyright © 2024, {_pyproject.get('author')}",
+        }
+        globals().update(_metadata)
+        return _metadata[name]
+    elif name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = (
@@ -27,6 +59,12 @@ __all__ = (
     "ConfigFileParser",
     "TraktHub",
     "TraktHubViewer",
+    "aget_anticipated",
+    "aget_popular",
+    "aget_trending",
+    "are_anticipated",
+    "are_popular",
+    "are_trending",
     "get_anticipated",
     "get_popular",
     "get_trending",
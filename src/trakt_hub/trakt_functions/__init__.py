@@ -1,4 +1,10 @@
 from .functions import (
+    aget_anticipated,
+    aget_popular,
+    aget_trending,
+    are_anticipated,
+    are_popular,
+    are_trending,
     get_anticipated,
     get_boxoffice,
     get_popular,
@@ -11,6 +17,12 @@ from .functions import (
 
 
 __all__ = (
+    "aget_anticipated",
+    "aget_popular",
+    "aget_trending",
+    "are_anticipated",
+    "are_popular",
+    "are_trending",
     "get_anticipated",
     "get_popular",
     "get_trending",
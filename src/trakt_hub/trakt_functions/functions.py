@@ -1,16 +1,20 @@
-import inspect
-
-from ..trakt_utils.type_hints import LiteralCategory, MoviesOnly, MoviesOrShows
+from ..trakt_utils.type_hints import (
+    Iterable,
+    LiteralCategory,
+    MoviesOnly,
+    MoviesOrShows,
+)
 from .wrappers import (
+    are_functions_wrapper,
+    async_viewer_wrapper,
     is_functions_wrapper,
+    public_getter,
     query_viewer_wrapper,
-    trakt_viewer_wrapper,
     validate_args_wrapper,
 )
 
 
-@validate_args_wrapper()
-@trakt_viewer_wrapper("trending")
+@public_getter("trending")
 def get_trending(category: MoviesOrShows) -> dict:
     """
     Get the trending movies or shows on Trakt.tv.
@@ -26,8 +30,7 @@ def get_trending(category: MoviesOrShows) -> dict:
     pass
 
 
-@validate_args_wrapper()
-@trakt_viewer_wrapper("popular")
+@public_getter("popular")
 def get_popular(category: MoviesOrShows) -> dict:
     """
     Get the popular movies or shows on Trakt.tv.
@@ -43,8 +46,7 @@ def get_popular(category: MoviesOrShows) -> dict:
     pass
 
 
-@validate_args_wrapper()
-@trakt_viewer_wrapper("anticipated")
+@public_getter("anticipated")
 def get_anticipated(category: MoviesOrShows) -> dict:
     """
     Get the anticipated movies or shows on Trakt.tv.
@@ -60,7 +62,7 @@ def get_anticipated(category: MoviesOrShows) -> dict:
     pass
 
 
-@trakt_viewer_wrapper("boxoffice")
+@public_getter("boxoffice", cat_override="movies")
 def get_boxoffice(category: MoviesOnly) -> dict:
     """
     Get the current box office movies.
@@ -75,6 +77,54 @@ def get_boxoffice(category: MoviesOnly) -> dict:
     pass
 
 
+@async_viewer_wrapper("trending")
+async def aget_trending(category: MoviesOrShows) -> dict:
+    """
+    Asynchronously get the trending movies or shows on Trakt.tv.
+    
+    #### Args:
+        - `category`: The category to get the trending data for.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A dictionary of the trending movies or shows.
+    """
+    pass
+
+
+@async_viewer_wrapper("popular")
+async def aget_popular(category: MoviesOrShows) -> dict:
+    """
+    Asynchronously get the popular movies or shows on Trakt.tv.
+    
+    #### Args:
+        - `category`: The category to get the popular data for.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A dictionary of the popular movies or shows.
+    """
+    pass
+
+
+@async_viewer_wrapper("anticipated")
+async def aget_anticipated(category: MoviesOrShows) -> dict:
+    """
+    Asynchronously get the anticipated movies or shows on Trakt.tv.
+    
+    #### Args:
+        - `category`: The category to get the anticipated data for.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A dictionary of the anticipated movies or shows.
+    """
+    pass
+
+
 @validate_args_wrapper(all_args=True)
 @is_functions_wrapper("trending")
 def is_trending(query: str, category: LiteralCategory) -> bool:
@@ -133,6 +183,60 @@ def is_anticipated(query: str, category: LiteralCategory) -> bool:
     pass
 
 
+@validate_args_wrapper(all_args=True)
+@are_functions_wrapper("trending")
+def are_trending(queries: Iterable[str], category: MoviesOrShows) -> list[bool]:
+    """
+    Check which of the queries are trending on Trakt.tv.
+    
+    #### Args:
+        - `queries`: The queries to check if they are trending.
+        - `category`: The category of the queries.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A list of booleans indicating if each query is trending.
+    """
+    pass
+
+
+@validate_args_wrapper(all_args=True)
+@are_functions_wrapper("popular")
+def are_popular(queries: Iterable[str], category: MoviesOrShows) -> list[bool]:
+    """
+    Check which of the queries are popular on Trakt.tv.
+    
+    #### Args:
+        - `queries`: The queries to check if they are popular.
+        - `category`: The category of the queries.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A list of booleans indicating if each query is popular.
+    """
+    pass
+
+
+@validate_args_wrapper(all_args=True)
+@are_functions_wrapper("anticipated")
+def are_anticipated(queries: Iterable[str], category: MoviesOrShows) -> list[bool]:
+    """
+    Check which of the queries are anticipated on Trakt.tv.
+    
+    #### Args:
+        - `queries`: The queries to check if they are anticipated.
+        - `category`: The category of the queries.
+            ~ "movies"
+            ~ "shows"
+    
+    #### Returns:
+        - A list of booleans indicating if each query is anticipated.
+    """
+    pass
+
+
 @validate_args_wrapper(all_args=True)
 @query_viewer_wrapper
 def trakt_query(query: str, category: LiteralCategory) -> dict:
@@ -150,14 +254,19 @@ def trakt_query(query: str, category: LiteralCategory) -> dict:
     pass
 
 
-__all__ = tuple(
-    k
-    for k, v in globals().items()
-    if all(
-        (
-            (k not in ("isfunction", "wraps")),
-            inspect.isfunction(v),
-            not any((k.startswith("_"), k.endswith("wrapper"))),
-        )
-    )
+__all__ = (
+    "get_trending",
+    "get_popular",
+    "get_anticipated",
+    "get_boxoffice",
+    "aget_trending",
+    "aget_popular",
+    "aget_anticipated",
+    "is_trending",
+    "is_popular",
+    "is_anticipated",
+    "are_trending",
+    "are_popular",
+    "are_anticipated",
+    "trakt_query",
 )
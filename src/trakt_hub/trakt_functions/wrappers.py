@@ -1,42 +1,213 @@
-from functools import wraps
+import sys
+from functools import partial, wraps
+from operator import itemgetter
+from threading import Lock
+from time import monotonic
+from rapidfuzz import fuzz, process
 
 from ..trakt_hub import TraktHub
 from ..trakt_utils.exceptions import THException
-from ..trakt_utils.utils import best_match, popkwargs, page_executor
+from ..trakt_utils.utils import (
+    _lower_queries,
+    apage_executor,
+    best_matches,
+    page_executor,
+)
 
+# Interned so cache keys and dispatch lookups compare by identity.
+_CATEGORIES = {s: sys.intern(s) for s in TraktHub.CATEGORIES}
+_PEOPLE = _CATEGORIES["people"]
 
-def _get_args(args=("query", "category"), **kwargs):
-    kwargs.update({"default_value": ""})
-    return popkwargs(*args, **kwargs)
+_get_title = itemgetter("Title")
 
+# Skips copying '__annotations__' and updating '__dict__' for every wrapper.
+_WRAPS = partial(
+    wraps, assigned=("__module__", "__name__", "__qualname__", "__doc__"), updated=()
+)
 
-def validate_args_wrapper(all_args: bool = False):
+# 'TraktHub' method used by 'trakt_query' (defaults to 'search').
+_METHOD_BY_CAT = {_PEOPLE: "track_person"}
+
+
+def _category(cat):
+    # Checked before the lookup, since an unhashable category can't be a dict key.
+    if not isinstance(cat, str):
+        raise THException("All arguments must be strings.")
+    # Same check as 'TraktHub', so short-circuited calls still reject a bad category.
+    if (interned := _CATEGORIES.get(cat)) is None:
+        raise THException(
+            f"{cat!r} is invalid and must be one of the following:\n{TraktHub.CATEGORIES}."
+        )
+    return interned
+
+
+def _get_qc(args, kwargs):
+    n = len(args)
+    q = args[0] if n else kwargs.get("query", "")
+    cat = args[1] if n > 1 else kwargs.get("category", "")
+    return q, _category(cat)
+
+
+class _TTLCache:
+    """
+    A small thread-safe cache whose entries expire after `ttl` seconds.
+
+    #### Attributes:
+        - `ttl`: The number of seconds an entry stays valid.
+    """
+
+    __slots__ = ("_ttl", "_data", "_lock", "_key_locks")
+
+    def __init__(self, ttl: float = 300):
+        self._ttl = ttl
+        self._data = {}
+        self._lock = Lock()
+        self._key_locks = {}
+
+    def _get_fresh(self, key):
+        # Must be called with the lock held.
+        if (entry := self._data.get(key)) is not None:
+            expires, value = entry
+            if expires > monotonic():
+                return value
+            del self._data[key]
+        return None
+
+    def get_or_compute(self, key, compute_func):
+        with self._lock:
+            if (value := self._get_fresh(key)) is not None:
+                return value
+            key_lock = self._key_locks.setdefault(key, Lock())
+        # Concurrent callers for the same key share one fetch,
+        # while fetches for other keys run in parallel.
+        with key_lock:
+            with self._lock:
+                if (value := self._get_fresh(key)) is not None:
+                    return value
+            value = compute_func()
+            self.set(key, value)
+            return value
+
+    def get(self, key):
+        with self._lock:
+            return self._get_fresh(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (monotonic() + self._ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Trakt.tv pages are refreshed about every 5 minutes.
+_page_cache = _TTLCache(ttl=300)
+# (get_func, cat) -> (page dict the titles came from, lowercased titles)
+_titles_cache = {}
+
+
+def _copy_pages(pages: dict):
+    # Callers get their own rows, so mutating a result never touches the cache.
+    return {idx: row.copy() for idx, row in pages.items()}
+
+
+def _page(get_func: str, cat: str):
+    return _page_cache.get_or_compute(
+        (get_func, cat), lambda: page_executor(TraktHub, cat, get_func)
+    )
+
+
+def _cached_page(get_func: str, cat: str):
+    return _copy_pages(_page(get_func, cat))
+
+
+def _cached_normalized_titles(get_func: str, cat: str):
+    # Lowercased once per cached page instead of on every fuzzy match,
+    # and recomputed whenever that page is refetched.
+    key = (get_func, cat)
+    pages = _page(get_func, cat)
+    entry = _titles_cache.get(key)
+    if entry is None or entry[0] is not pages:
+        entry = _titles_cache[key] = (
+            pages,
+            tuple(map(str.lower, map(_get_title, pages.values()))),
+        )
+    return entry[1]
+
+
+def _cache_clear():
+    _page_cache.clear()
+    _titles_cache.clear()
+
+
+def validate_args_wrapper(func=None, *, all_args: bool = False):
     def decorator(func):
-        @wraps(func)
+        err_msg = "Function {func_name!r} requires {num_args} to be provided.".format(
+            func_name=func.__name__,
+            num_args="all arguments" if all_args else "an argument",
+        )
+
+        @_WRAPS(func)
         def wrapper(*args, **kwargs):
-            if not any((args, kwargs)):
-                raise THException(
-                    "Function {func_name!r} requires {num_args} to be provided.".format(
-                        func_name=func.__name__,
-                        num_args="all arguments" if all_args else "an argument",
-                    )
-                )
+            if not args and not kwargs:
+                raise THException(err_msg)
             return func(*args, **kwargs)
 
+        if hasattr(func, "cache_clear"):
+            wrapper.cache_clear = func.cache_clear
+        return wrapper
+
+    return decorator(func) if func else decorator
+
+
+def public_getter(get_func: str, *, cat_override: str = None):
+    # Combines 'validate_args_wrapper' with the page lookup in a single wrapper.
+    def decorator(func):
+        if cat_override is not None:
+            # e.g. Box office data only exists for movies.
+            @_WRAPS(func)
+            def wrapper(*args, **kwargs):
+                return _cached_page(get_func, cat_override)
+
+        else:
+            err_msg = f"Function {func.__name__!r} requires an argument to be provided."
+
+            @_WRAPS(func)
+            def wrapper(*args, **kwargs):
+                if "category" in kwargs:
+                    cat = kwargs["category"]
+                elif args:
+                    cat = args[0]
+                else:
+                    raise THException(err_msg)
+                return _cached_page(get_func, _category(cat))
+
+        wrapper.cache_clear = _cache_clear
         return wrapper
 
     return decorator
 
 
-def trakt_viewer_wrapper(get_func: str):
+def async_viewer_wrapper(get_func: str):
     def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            cat = kwargs.get("category", *args)
-            if get_func == "boxoffice":
-                cat = "movies"
-            return page_executor(TraktHub, cat, get_func)
+        err_msg = f"Function {func.__name__!r} requires an argument to be provided."
+
+        @_WRAPS(func)
+        async def wrapper(*args, **kwargs):
+            if "category" in kwargs:
+                cat = kwargs["category"]
+            elif args:
+                cat = args[0]
+            else:
+                raise THException(err_msg)
+            key = (get_func, _category(cat))
+            if (pages := _page_cache.get(key)) is None:
+                pages = await apage_executor(TraktHub, key[1], get_func)
+                _page_cache.set(key, pages)
+            return _copy_pages(pages)
 
+        wrapper.cache_clear = _cache_clear
         return wrapper
 
     return decorator
@@ -44,29 +215,62 @@ def trakt_viewer_wrapper(get_func: str):
 
 def is_functions_wrapper(get_func: str):
     def decorator(func):
-        @wraps(func)
+        @_WRAPS(func)
         def wrapper(*args, **kwargs):
-            q, cat, kwargs = _get_args(*args, **kwargs)
-            executed_pages = page_executor(TraktHub, cat, get_func)
-            titles = [i["Title"] for i in executed_pages.values()]
-            if not (found_match := best_match(q, titles)):
+            q, cat = _get_qc(args, kwargs)
+            if not q:
                 return False
-            _, score, _ = found_match
-            return score >= 90
+            # Only the first call per (section, category) hits Trakt.tv.
+            titles = _cached_normalized_titles(get_func, cat)
+            # 'score_cutoff' lets rapidfuzz discard titles below 90 in its C scan.
+            found_match = process.extractOne(
+                q.lower(), titles, scorer=fuzz.ratio, processor=None, score_cutoff=90
+            )
+            return found_match is not None
+
+        wrapper.cache_clear = _cache_clear
+        return wrapper
+
+    return decorator
+
+
+def are_functions_wrapper(get_func: str):
+    def decorator(func):
+        @_WRAPS(func)
+        def wrapper(*args, **kwargs):
+            # Rejects a single string before any page is fetched.
+            queries = _lower_queries(args[0] if args else kwargs.get("queries", ()))
+            cat = args[1] if len(args) > 1 else kwargs.get("category", "")
+            cat = _category(cat)
+            if not queries:
+                return []
+            titles = _cached_normalized_titles(get_func, cat)
+            # One (queries x titles) score matrix instead of a scan per query.
+            return [
+                m is not None for m in best_matches(queries, titles, score_cutoff=90)
+            ]
 
+        wrapper.cache_clear = _cache_clear
         return wrapper
 
     return decorator
 
 
 def query_viewer_wrapper(__func):
-    @wraps(__func)
+    @_WRAPS(__func)
     def wrapper(*args, **kwargs):
-        q, cat, kwargs = _get_args(*args, **kwargs)
-        tk_hub = TraktHub(query=q, category=cat)
-        return getattr(tk_hub, ["search", "track_person"][cat == "people"])()
+        q, cat = _get_qc(args, kwargs)
+        method = _METHOD_BY_CAT.get(cat, "search")
+        return getattr(TraktHub(query=q, category=cat), method)()
 
     return wrapper
 
 
-__all__ = tuple(k for k in globals() if k.endswith("wrapper"))
+__all__ = (
+    "validate_args_wrapper",
+    "public_getter",
+    "async_viewer_wrapper",
+    "is_functions_wrapper",
+    "are_functions_wrapper",
+    "query_viewer_wrapper",
+)
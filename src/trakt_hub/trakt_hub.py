@@ -1,8 +1,8 @@
 import re
 import sys
-from collections import OrderedDict
-from functools import partial, wraps
-from operator import itemgetter
+from functools import lru_cache, wraps
+from itertools import count
+from operator import attrgetter, itemgetter, methodcaller
 from string import punctuation
 from time import sleep
 
@@ -18,13 +18,102 @@ from .trakt_utils.type_hints import (
 from .trakt_utils.exceptions import THException
 from .trakt_utils.utils import (
     BeautifulSoup,
-    enumerate_at_one,
+    SoupStrainer,
+    _TagIndex,
+    _has_class,
     get_datetime,
     get_terminal_size,
-    removefix,
 )
 
 
+# Listing rows are joined with this separator and scanned in a single `findall` pass.
+# Each pattern is anchored to one row and never lets a character class cross `_SEP`.
+_SEP = "\x1e"
+_ROW_START = r"(?<![^\x1e])"
+_ROW_END = r"(?=\n?(?![^\x1e]))"
+# Unclean Example: 41 people watchingSonic the Hedgehog 3 2024
+_TRENDING_RE = re.compile(
+    _ROW_START
+    + r"(\d+)[^\S\x1e]+people watching([^\n\x1e]+?)[^\S\x1e]+(\d{4})"
+    + _ROW_END
+)
+# Unclean Example: Deadpool 2016
+_YEAR_RE = re.compile(_ROW_START + r"(\w+)([^\n\x1e]*?)[^\S\x1e](\d{4})" + _ROW_END)
+# Unclean Example: $36,000,000Dog Man 2025
+_BOXOFFICE_RE = re.compile(_ROW_START + r"(\$\d[\d,]*)([^\d\x1e]+)(\d{4})" + _ROW_END)
+# Example: BirthplaceBeirut, Lebanon
+_STAT_RE = re.compile(r"(Age|Gender|Birthday|Birthplace|Known For)(.*)", re.S)
+# Example: Leonardo DiCaprio [Cobb]
+_ACTOR_RE = re.compile(r"^(.*?)\s*\[((.*?))\]$")
+_PUNCT_TABLE = str.maketrans("", "", punctuation)
+_HASH_TO_SPACE = str.maketrans("#", " ")
+_TEXT = attrgetter("text")
+_GET_TEXT_HASH = methodcaller("get_text", separator="#", strip=True)
+_VALUE_FMT = "{:>5}• {k}{:>5}: {v}".format
+
+
+def _value_string(k, v):
+    return _VALUE_FMT(" ", " ", k=k, v=v)
+
+
+# Only the tags each handler reads are built into the tree.
+# Anything not listed here (e.g. `search`) uses `APIParser`'s default strainer.
+_TITLES_STRAINER = SoupStrainer("div", class_=_has_class("titles"))
+_TITLES_LINK_STRAINER = SoupStrainer("a", class_=_has_class("titles-link"))
+_STRAINERS = {
+    ("shows", "trending"): _TITLES_STRAINER,
+    ("movies", "trending"): _TITLES_STRAINER,
+    ("shows", "popular"): _TITLES_STRAINER,
+    ("movies", "popular"): _TITLES_STRAINER,
+    ("shows", "anticipated"): _TITLES_LINK_STRAINER,
+    ("movies", "anticipated"): _TITLES_LINK_STRAINER,
+    ("movies", "boxoffice"): _TITLES_STRAINER,
+    ("calendars", "shows"): _TITLES_STRAINER,
+    # Person pages are keyed by the query, so they match on category alone.
+    "people": SoupStrainer("div", class_=_has_class("titles", "col-lg-8")),
+}
+
+
+def _strainer_for(category: str, section: str):
+    return _STRAINERS.get((category, section), _STRAINERS.get(category))
+
+
+def _match_rows(pattern: re.Pattern, rows: list[str]):
+    # Matched rows are numbered from 1 without gaps, so merged pages never collide.
+    return zip(count(1), pattern.findall(_SEP.join(rows)))
+
+
+def _clean_title_year(contents: list[str]):
+    return {
+        idx: {
+            "Title": first_word + rest,
+            "Year": int(year),
+        }
+        for idx, (first_word, rest, year) in _match_rows(_YEAR_RE, contents)
+    }
+
+
+@lru_cache(maxsize=None)
+def _check_section(category: str, section: str):
+    # Raises for an invalid (category, section) pair; valid pairs are remembered.
+    if section not in TraktHub._ALL_SET:
+        raise THException(
+            f"{section!r} is not a valid section.\nSection Options:"
+            f"\nMovie Sections: {TraktHub.MOVIE_SECTIONS}"
+            f"\nShow Sections: {TraktHub.SHOW_SECTIONS}"
+            f"\nCalendar Sections: {TraktHub.CALENDARS_SECTIONS}"
+        )
+
+    # Check if section is in the correct category
+    cat_sections = TraktHub._CAT_TO_SET.get(category)
+    if cat_sections is not None and section not in cat_sections:
+        correct_cat = TraktHub._SECTION_TO_CAT[section]
+        raise THException(
+            f"{section!r} is not a valid section for category {category!r}."
+            f"\nThis section is for category {correct_cat!r}."
+        )
+
+
 class TraktHubViewer:
     """
     A class to view the contents of the Trakt.tv.
@@ -51,6 +140,8 @@ class TraktHubViewer:
         "_category",
         "_section",
         "_html_contents",
+        "_tag_index",
+        "_handler",
     )
 
     def __init__(
@@ -63,151 +154,138 @@ class TraktHubViewer:
         self._category = category
         self._section = section
         self._html_contents = html_contents
+        self._tag_index = None
+        # The cleaning handler is fixed by (category, section), so resolve it once here.
+        self._handler = self._HANDLERS.get(
+            (category, section), self._CATEGORY_HANDLERS.get(category)
+        )
 
-    def _th_viewer():
-        def decorator(func):
-            @wraps(func)
-            def wrapper(self, *args, **kwargs):
-                parser = func(self, *args, **kwargs)
-                html_contents = parser.parse_html_contents(parser.contents)
-                section = self._query if not args else args[0]
-                return TraktHubViewer(
-                    self._category, section, html_contents=html_contents
-                ).get_contents()
-
-            return wrapper
-
-        return decorator
-
-    def _find_all(self, tag: str, *, text: bool = False, strip: bool = False, **kwargs):
-        tag_contents = self._html_contents.find_all(tag, **kwargs)
-        if any((text, strip)):
-            format_func = lambda x: x.get_text(strip=True) if strip else x.text
-            return [format_func(i) for i in tag_contents]
-        return tag_contents
-
-    def _clean_contents(self):
-        text_findall_func = partial(self._find_all, text=True)
-        common_func = partial(text_findall_func, "div", class_="titles")
-
-        def second_common_func(contents):
-            pattern = re.compile(r"(\w+)(.*?)\s(\d{4})$")
-            return {
-                idx: {
-                    "Title": match.group(1) + match.group(2),
-                    "Year": int(match.group(3)),
-                }
-                for idx, i in enumerate_at_one(contents)
-                if (match := pattern.match(i))
+    def _iter_tags(self, tag: str, **kwargs):
+        if kwargs.keys() == {"class_"}:
+            if self._tag_index is None:
+                self._tag_index = _TagIndex(self._html_contents)
+            # Matches are streamed off the index, so text lookups never build a Tag list.
+            return self._tag_index.iter_all(tag, kwargs["class_"])
+        return self._html_contents.find_all(tag, **kwargs)
+
+    def _find_all(self, tag: str, **kwargs):
+        return list(self._iter_tags(tag, **kwargs))
+
+    def _find_all_text(self, tag: str, **kwargs):
+        return list(map(_TEXT, self._iter_tags(tag, **kwargs)))
+
+    # ^ -------------------Handlers for (Movies/Shows)----------------- ^ #
+    def _clean_trending(self):
+        # Unclean Example: 41 people watchingSonic the Hedgehog 3 2024
+        trending = self._find_all_text("div", class_="titles")
+        return {
+            idx: {
+                "Title": title.strip(),
+                "Watch Count": int(watch_count),
+                "Year": int(year),
+            }
+            for idx, (watch_count, title, year) in _match_rows(_TRENDING_RE, trending)
+        }
+
+    def _clean_popular(self):
+        # Unclean Example: Deadpool 2016
+        popular_contents = self._find_all_text("div", class_="titles")
+        return _clean_title_year(popular_contents)
+
+    def _clean_anticipated(self):
+        # Different html tag
+        # Unclean Example: Daredevil: Born Again 2025
+        anticipated = self._find_all_text("a", class_="titles-link")
+        return _clean_title_year(anticipated)
+
+    def _clean_boxoffice(self):
+        # Example: $36,000,000Dog Man 2025
+        boxoffice = self._find_all_text("div", class_="titles")
+        return {
+            idx: {
+                "Title": title.strip(),
+                "Total Budget": budget,
+                "Year": int(year),
+            }
+            for idx, (budget, title, year) in _match_rows(_BOXOFFICE_RE, boxoffice)
+        }
+
+    # ^ -------------------------------------------------------------- ^ #
+
+    # ^ -------------------Handlers for (Calendars)----------------- ^ #
+    def _clean_calendar_shows(self):
+        # Example: ' 1:00 amCBS7x11 Welcome to the e-Neighborhood'
+        calendar_shows = self._find_all("div", class_="titles has-worded-image")
+        cleaned_contents = {}
+        for idx, i in enumerate(calendar_shows, 1):
+            # '7x11 Welcome to the e-Neighborhood' -> ('7', '11', 'Welcome...')
+            head, _, title = i.find(class_="titles-link").text.partition(" ")
+            season, sep, episode = head.partition("x")
+            if not sep:
+                continue
+            cleaned_contents[idx] = {
+                "Title": title,
+                "Network": i.find(class_="generic").text,
+                "Season": season,
+                "Episode": episode,
+                "Time": i.h4.get_text(strip=True),
             }
 
-        cleaned_contents = None
-
-        match (self._category, self._section):
-            # ^ -------------------Match Case for (Movies/Shows)----------------- ^ #
-            case ("shows", "trending") | ("movies", "trending"):
-                # Unclean Example: 41 people watchingSonic the Hedgehog 3 2024
-                trending = common_func()
-                pattern = re.compile(r"(\d+)\s+people watching(.+?)\s+(\d{4})$")
-                cleaned_contents = {
-                    idx: {
-                        "Title": match.group(2).strip(),
-                        "Watch Count": int(match.group(1)),
-                        "Year": int(match.group(3)),
-                    }
-                    for idx, i in enumerate_at_one(trending)
-                    if (match := pattern.match(i))
-                }
-
-            case ("shows", "popular") | ("movies", "popular"):
-                # Unclean Example: Deadpool 2016
-                popular_contents = common_func()
-                cleaned_contents = second_common_func(popular_contents)
-            case ("shows", "anticipated") | ("movies", "anticipated"):
-                # Different html tag
-                # Unclean Example: Daredevil: Born Again 2025
-                anticipated = text_findall_func("a", class_="titles-link")
-                cleaned_contents = second_common_func(anticipated)
-            case ("movies", "boxoffice"):
-                # Example: $36,000,000Dog Man 2025
-                boxoffice = common_func()
-                pattern = re.compile(r"(\$\d[\d,]*)(\D+)(\d{4})$")
-                cleaned_contents = {
-                    idx: {
-                        "Title": match.group(2).strip(),
-                        "Total Budget": match.group(1),
-                        "Year": int(match.group(3)),
-                    }
-                    for idx, i in enumerate_at_one(boxoffice)
-                    if (match := pattern.match(i))
-                }
-
-            # ^ -------------------------------------------------------------- ^ #
-
-            # ^ -------------------Match Case for (Calendars)----------------- ^ #
-            case ("calendars", "shows"):
-                # Example: ' 1:00 amCBS7x11 Welcome to the e-Neighborhood'
-                calendar_shows = self._find_all("div", class_="titles has-worded-image")
-                pattern = re.compile(r"(\d{1,3}x\d{1,3})\s(\D+)")
-
-                cleaned_contents = {
-                    idx: {
-                        "Title": (
-                            _title_contents := pattern.match(
-                                i.find(class_="titles-link").text
-                            )
-                        ).group(2),
-                        "Network": i.find(class_="generic").text,
-                        **{
-                            k: _title_contents.group(1).split("x")[v]
-                            for k, v in (("Season", 0), ("Episode", 1))
-                        },
-                        "Time": i.h4.get_text(strip=True),
-                    }
-                    for idx, i in enumerate_at_one(calendar_shows)
-                }
-
-                #!> FINISH CALENDARS SECTIONS
-            # ^ --------------------------------------------------------- ^ #
-
-            # ^ -------------------Match Case for (People)----------------- ^ #
-            case ("people", section):
-                common_func = partial(self._find_all, "div")
-                person_credits = {
-                    idx: i.find(class_="ellipsify").text
-                    for idx, i in enumerate_at_one(common_func(class_="titles"))
-                }
-
-                person_descr_details = common_func(class_="col-lg-8 col-md-7")
-                person_description = next(
-                    (i.text.lstrip(i.ul.text) for i in person_descr_details)
-                )
+        #!> FINISH CALENDARS SECTIONS
+        return cleaned_contents
 
-                # Example: ['Age60', 'GenderMale', 'Birthday1964-09-02', 'BirthplaceBeirut, Lebanon', 'Known ForActing']
-                person_stats = ("Age", "Gender", "Birthday", "Birthplace", "Known For")
-                person_details_uncleaned = next(
-                    (
-                        [j.text for j in i.ul.find_all("li")]
-                        for i in person_descr_details
-                    )
-                )
+    # ^ --------------------------------------------------------- ^ #
 
-                cleaned_contents = OrderedDict(
-                    {
-                        "Person": self._section.lstrip("/").title(),
-                        **{
-                            j: i.removeprefix(j)
-                            for i, j in zip(person_details_uncleaned, person_stats)
-                        },
-                        "Description": person_description,
-                        "Credits": person_credits,
-                    }
-                )
-            # ^ --------------------------------------------------------- ^#
+    # ^ -------------------Handlers for (People)----------------- ^ #
+    def _clean_person(self):
+        person_credits = dict(
+            zip(
+                count(1),
+                (
+                    i.find(class_="ellipsify").text
+                    for i in self._iter_tags("div", class_="titles")
+                ),
+            )
+        )
 
-        # ^ No default case needed as all cases are covered and will raise an exception if not found ^ #
+        person_descr_details = self._find_all("div", class_="col-lg-8 col-md-7")[0]
+        stats_list = person_descr_details.ul
+        # The description is whatever text follows the stats list.
+        person_description = person_descr_details.text.partition(stats_list.text)[2]
+
+        # Example: ['Age60', 'GenderMale', 'Birthday1964-09-02', 'BirthplaceBeirut, Lebanon', 'Known ForActing']
+        # Each stat is keyed by its own label, so missing or reordered rows stay paired.
+        person_details = dict(
+            match.groups()
+            for match in map(_STAT_RE.match, map(_TEXT, stats_list.find_all("li")))
+            if match
+        )
 
-        return cleaned_contents
+        return {
+            "Person": self._section.lstrip("/").title(),
+            **person_details,
+            "Description": person_description,
+            "Credits": person_credits,
+        }
+
+    # ^ --------------------------------------------------------- ^#
+
+    _HANDLERS = {
+        ("shows", "trending"): _clean_trending,
+        ("movies", "trending"): _clean_trending,
+        ("shows", "popular"): _clean_popular,
+        ("movies", "popular"): _clean_popular,
+        ("shows", "anticipated"): _clean_anticipated,
+        ("movies", "anticipated"): _clean_anticipated,
+        ("movies", "boxoffice"): _clean_boxoffice,
+        ("calendars", "shows"): _clean_calendar_shows,
+    }
+    # Every section of a category is handled the same way (e.g. any person query).
+    _CATEGORY_HANDLERS = {"people": _clean_person}
+
+    def _clean_contents(self):
+        # Pairs without a handler have nothing to clean.
+        return self._handler(self) if self._handler is not None else None
 
     def get_contents(self):
         return self._clean_contents()
@@ -221,27 +299,23 @@ class TraktHubViewer:
             print(contents)
             sys.exit()
 
-        cli_args = sys.argv
-        verbose = False
-
-        if "--verbose" in cli_args:
-            cli_args.remove("--verbose")
-            verbose = True
+        verbose = "--verbose" in sys.argv
+        cli_args = [arg for arg in sys.argv if arg != "--verbose"]
 
         function_name = query = cli_args[1]
         terminal_col, _terminal_lines = get_terminal_size()
+        # The formatted display is collected here and written to stdout once at the end.
+        out = []
+        emit = out.append
+
+        sep = "-" * (terminal_col // 2)
+        header_fmt = "TraktHub - {} {}"
+        header_width = ((terminal_col + len(header_fmt)) // 2) - len("TraktHub")
 
         def print_header(*args):
             current_dt = get_datetime(with_time=True)
-            sep = "-" * (terminal_col // 2)
-            header = "TraktHub - {} {}"
-            print(sep, end="\n\n")
-            header = header.format(
-                *args,
-            ).center(((terminal_col + len(header)) // 2) - len("TraktHub"), "-")
-            print(header, end="\n\n")
-            print(sep)
-            print(f"Time Now: {current_dt}", end="\n\n")
+            header = header_fmt.format(*args).center(header_width, "-")
+            emit(f"{sep}\n\n{header}\n\n{sep}\nTime Now: {current_dt}\n\n")
 
         def verbose_output(code: int, c=""):
             match code:
@@ -258,8 +332,6 @@ class TraktHubViewer:
                     print("~ The formatted data will now be displayed.", end="\n\n")
                     sleep(1)
 
-        value_string = partial("{:>5}• {k}{:>5}: {v}".format, " ", " ")
-        
         if verbose:
             verbose_output(1)
 
@@ -287,13 +359,13 @@ class TraktHubViewer:
                 match diff_set(v):
                     case 0:
                         # Get-Popular/Anticipated functions
-                        print(f"{idx}: {v['Title']} ({v['Year']})")
+                        emit(f"{idx}: {v['Title']} ({v['Year']})\n")
                     case 1:
                         # Boxoffice
                         def _format(*args):
-                            print(
-                                f"{idx}-{v['Title']} ({v['Year']})",
-                                "\n{:>5}• {}: {}".format(" ", *args),
+                            emit(
+                                f"{idx}-{v['Title']} ({v['Year']}) "
+                                + "\n{:>5}• {}: {}\n".format(" ", *args)
                             )
 
                         uncommon_keys = ("Total Budget", "Watch Count")
@@ -315,23 +387,24 @@ class TraktHubViewer:
                 print_header(*header_title)
 
                 for header_section, header_values in contents.items():
-                    print(f"\n\n[{header_section}]")
+                    emit(f"\n\n[{header_section}]\n")
                     for key, value in header_values.items():
                         if isinstance(value, (list, tuple)):
                             if header_section == "Cast":
-                                p = re.compile(r"^(.*?)\s*\[((.*?))\]$")
                                 actors = tuple(
-                                    (m.group(1), f"as {m.group(2)}")
+                                    (m[1], f"as {m[2]}")
                                     for av in value
-                                    if (m := p.match(av))
+                                    if (m := _ACTOR_RE.match(av))
                                 )
                                 for actors_name, role_name in actors:
-                                    print(value_string(k=actors_name, v=role_name))
+                                    emit(
+                                        _value_string(k=actors_name, v=role_name) + "\n"
+                                    )
                             else:
                                 value = ", ".join(map(str, value))
-                                print(value_string(k=key, v=value))
+                                emit(_value_string(k=key, v=value) + "\n")
                         else:
-                            print(value_string(k=key, v=value))
+                            emit(_value_string(k=key, v=value) + "\n")
             elif cat == "people":
                 person = contents["Person"]
                 keyval_sep = "-" * 6
@@ -340,24 +413,37 @@ class TraktHubViewer:
 
                 for key, value in contents.items():
                     if key == "Credits":
-                        print(f"• {key}:")
+                        emit(f"• {key}:\n")
                         for idx, credit in value.items():
-                            print(f"{'':2}{idx}:{keyval_sep} {credit}")
+                            emit(f"{'':2}{idx}:{keyval_sep} {credit}\n")
                     else:
                         if key == "Description":
                             value = "\n" + value + "\n"
                             keyval_sep = ""
-                        print(f"• {key}:{keyval_sep} {value}")
+                        emit(f"• {key}:{keyval_sep} {value}\n")
             elif cat == "shows":
                 show_title = contents["Basic Info"]["Title"]
                 print_header(show_title, "")
                 
                 for header_section, header_values in contents.items():
-                    print(f"[{header_section}]")
+                    emit(f"[{header_section}]\n")
                     for section, values in header_values.items():
                         if isinstance(values, tuple):
                             values = ", ".join(values)
-                        print(value_string(k=section, v=values))
+                        emit(_value_string(k=section, v=values) + "\n")
+
+        sys.stdout.write("".join(out))
+
+
+def _th_viewer(func):
+    # Turns a method returning an `APIParser` into one returning the cleaned contents.
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        parser = func(self, *args, **kwargs)
+        section = args[0] if args else kwargs.get("section", self._query)
+        return self._view_contents(parser, section)
+
+    return wrapper
 
 
 class TraktHub:
@@ -423,6 +509,7 @@ class TraktHub:
     
     #### Methods:
         - `track_hub`: Track the hub for the provided section.
+        - `atrack_hub`: Asynchronously track the hub for the provided section.
         - `track_person`: Track the person for the provided query.
         - `search`: Search for the provided query.
     
@@ -443,6 +530,18 @@ class TraktHub:
         "dvd",
     )
     _ALL_SECTIONS: StrTuple = (*SHOW_SECTIONS, *MOVIE_SECTIONS, *CALENDARS_SECTIONS)
+    _MOVIE_SET = frozenset(MOVIE_SECTIONS)
+    _SHOW_SET = frozenset(SHOW_SECTIONS)
+    _CAL_SET = frozenset(CALENDARS_SECTIONS)
+    _ALL_SET = frozenset(_ALL_SECTIONS)
+    _CAT_TO_SET = {"movies": _MOVIE_SET, "shows": _SHOW_SET, "calendars": _CAL_SET}
+    # Sections shared by several categories resolve to the first of movies, shows, calendars.
+    _SECTION_TO_CAT = {
+        **{s: "calendars" for s in CALENDARS_SECTIONS},
+        **{s: "shows" for s in SHOW_SECTIONS},
+        **{s: "movies" for s in MOVIE_SECTIONS},
+    }
+    _CATEGORIES_SET = frozenset(CATEGORIES)
 
     _APIParser = APIParser
 
@@ -470,7 +569,7 @@ class TraktHub:
         query, category = args
         page_number = kwargs.get("page_number", "")
 
-        if any((map(lambda x: not isinstance(x, str), (query, category)))):
+        if not (isinstance(query, str) and isinstance(category, str)):
             raise THException("All arguments must be strings.")
 
         if not isinstance(page_number, IntOrStr):
@@ -478,89 +577,69 @@ class TraktHub:
                 f"Page number must be an integer or a string, not {type(page_number).__name__}."
             )
 
-        if category not in (categories := self.CATEGORIES):
+        if category not in self._CATEGORIES_SET:
             raise THException(
-                f"{category!r} is invalid and must be one of the following:\n{categories}."
+                f"{category!r} is invalid and must be one of the following:\n{self.CATEGORIES}."
             )
 
         if query or category == "people":
-            cleaned_query = query.translate(str.maketrans("", "", punctuation))
+            cleaned_query = query.translate(_PUNCT_TABLE)
             query = "/" + "-".join(cleaned_query.split())
 
         return query, category, page_number
 
     def _validate_section(self, section: str):
-        movie_sections, show_sections, calendars_sections = (
-            self.MOVIE_SECTIONS,
-            self.SHOW_SECTIONS,
-            self.CALENDARS_SECTIONS,
-        )
-
-        if section not in self._ALL_SECTIONS:
-            raise THException(
-                f"{section!r} is not a valid section.\nSection Options:"
-                f"\nMovie Sections: {movie_sections}"
-                f"\nShow Sections: {show_sections}"
-                f"\nCalendar Sections: {calendars_sections}"
-            )
-
-        cat = self._category
-
-        def __raise_exception(main_sections):
-            _all_sections = {
-                "movies": movie_sections,
-                "shows": show_sections,
-                "calendars": calendars_sections,
-            }
-            correct_cat = next((k for k, v in _all_sections.items() if section in v))
-            if section not in main_sections:
-                raise THException(
-                    f"{section!r} is not a valid section for category {cat!r}."
-                    f"\nThis section is for category {correct_cat!r}."
-                )
-
-        # Check if section is in the correct category
-        match cat:
-            case "movies":
-                __raise_exception(movie_sections)
-            case "shows":
-                __raise_exception(show_sections)
-            case "calendars":
-                __raise_exception(calendars_sections)
+        _check_section(self._category, section)
 
         if pg := self._page_number:
             section += f"?page={pg}"
 
         return section
 
-    @TraktHubViewer._th_viewer()
+    def _hub_parser(self, section: LiteralSection):
+        valid_section = self._validate_section(section)
+        return self._APIParser(self._main_url, valid_section)
+
+    def _view_contents(self, parser: APIParser, section: str):
+        html_contents = parser.parse_html_contents(
+            parser.contents, parse_only=_strainer_for(self._category, section)
+        )
+        return TraktHubViewer(
+            self._category, section, html_contents=html_contents
+        ).get_contents()
+
+    @_th_viewer
     def track_hub(
         self,
         section: LiteralSection,
     ):
-        valid_section = self._validate_section(section)
-        return self._APIParser(self._main_url, valid_section)
+        return self._hub_parser(section)
+
+    async def atrack_hub(
+        self,
+        section: LiteralSection,
+    ):
+        parser = self._hub_parser(section)
+        await self._APIParser._fetch_many((parser,))
+        return self._view_contents(parser, section)
 
-    @TraktHubViewer._th_viewer()
+    @_th_viewer
     def track_person(self):
         return self._APIParser(self._main_url)
 
     def _search_show(self, __contents):
         show_title = self._main_url.split("/")[-1].split("-")[0].title()
-        show_stats = __contents.find_all(
+        tag_index = _TagIndex(__contents)
+        show_stats = tag_index.find(
             "div",
             class_="col-md-10 col-md-offset-2 col-sm-9 col-sm-offset-3 ul-wrapper",
         )
 
         def str_translate(str_obj):
-            return str_obj.translate(str.maketrans("#", " ")).strip()
-
-        rating_stats_unclean = next(
-            [
-                i.get_text(strip=True, separator="#")
-                for i in i.find_all("div", class_="number")
-            ]
-            for i in show_stats
+            return str_obj.translate(_HASH_TO_SPACE).strip()
+
+        rating_stats_unclean = list(
+            map(_GET_TEXT_HASH, show_stats.find_all("div", class_="number"))
         )
         rating_stats_unclean.pop(1)
         (
@@ -578,11 +657,13 @@ class TraktHub:
             num_favorited,
         ) = rating_stats_unclean
 
-        loved_perc, loved_votes = str_translate(removefix(loved_votes, "votes")).split()
-        imdb_score, imdb_nums = imdb_stats.split("#")
-        tmdb_score, tmdb_nums = tmdb_stats.split("#")
+        loved_perc, loved_votes = str_translate(
+            loved_votes.removesuffix("votes")
+        ).split()
+        imdb_score, _, imdb_nums = imdb_stats.partition("#")
+        tmdb_score, _, tmdb_nums = tmdb_stats.partition("#")
         fresh_value = str_translate(fresh_value)
-        audience = str_translate(removefix(audience, "Audience"))
+        audience = str_translate(audience.removesuffix("Audience"))
         justwatch_score, *justwatch_trend = str_translate(streaming_rank).split()
         justwatch_trend = " ".join(justwatch_trend)
         (
@@ -593,8 +674,8 @@ class TraktHub:
             num_of_lists,
             num_favorited,
         ) = [
-            str_translate(removefix(*i))
-            for i in (
+            str_translate(stat.removesuffix(suffix))
+            for stat, suffix in (
                 (watchers_count, "watchers"),
                 (num_of_plays, "plays"),
                 (collected_count, "collected"),
@@ -604,56 +685,41 @@ class TraktHub:
             )
         ]
 
-        show_details = __contents.find_all("div", class_="col-lg-8 col-md-7")
-        spoiler = next((i.find("div", id="tagline").text for i in show_details))
-        description = next(
-            (i.find("div", class_="readmore").text for i in show_details)
-        )
-        num_of_seasons = next(
-            (
-                i.find("a", class_="season-count").text
-                for i in __contents.find_all(
-                    "div", class_="col-md-2 col-sm-3 hidden-xs sticky-wrapper"
-                )
-            )
+        show_details = tag_index.find("div", class_="col-lg-8 col-md-7")
+        spoiler = show_details.find("div", id="tagline").text
+        description = show_details.find("div", class_="readmore").text
+        num_of_seasons = (
+            tag_index.find("div", class_="col-md-2 col-sm-3 hidden-xs sticky-wrapper")
+            .find("a", class_="season-count")
+            .text
         )
 
-        organized_data = OrderedDict(
-            {
-                "Basic Info": OrderedDict(
-                    {
-                        "Title": show_title,
-                        "Total Seasons": num_of_seasons,
-                    }
-                ),
-                "Ratings": OrderedDict(
-                    {
-                        "Loved %": (loved_perc, loved_votes),
-                        "IMDb": (imdb_score, imdb_nums),
-                        "TMDb": (tmdb_score, tmdb_nums),
-                        "Rotten Tomatoe": fresh_value,
-                        "JustWatch": (justwatch_score, justwatch_trend),
-                        "Audience %": audience,
-                    }
-                ),
-                "Total Engagement": OrderedDict(
-                    {
-                        "Watchers": watchers_count,
-                        "Plays": num_of_plays,
-                        "Collected": collected_count,
-                        "Comments": num_of_comments,
-                        "Personal Lists": num_of_lists,
-                        "Favorited": num_favorited,
-                    }
-                ),
-                "Narrative": OrderedDict(
-                    {
-                        "Spoiler": spoiler,
-                        "Description": description,
-                    }
-                ),
-            }
-        )
+        organized_data = {
+            "Basic Info": {
+                "Title": show_title,
+                "Total Seasons": num_of_seasons,
+            },
+            "Ratings": {
+                "Loved %": (loved_perc, loved_votes),
+                "IMDb": (imdb_score, imdb_nums),
+                "TMDb": (tmdb_score, tmdb_nums),
+                "Rotten Tomatoe": fresh_value,
+                "JustWatch": (justwatch_score, justwatch_trend),
+                "Audience %": audience,
+            },
+            "Total Engagement": {
+                "Watchers": watchers_count,
+                "Plays": num_of_plays,
+                "Collected": collected_count,
+                "Comments": num_of_comments,
+                "Personal Lists": num_of_lists,
+                "Favorited": num_favorited,
+            },
+            "Narrative": {
+                "Spoiler": spoiler,
+                "Description": description,
+            },
+        }
 
         return organized_data
 
@@ -663,7 +729,8 @@ class TraktHub:
         if self._category == "shows":
             return self._search_show(parsed_contents)
 
-        flix_title_contents = parsed_contents.find(
+        tag_index = _TagIndex(parsed_contents)
+        flix_title_contents = tag_index.find(
             "div",
             class_="col-md-10 col-md-offset-2 col-sm-9 col-sm-offset-3 mobile-title",
         ).h1.get_text(separator="#")
@@ -678,19 +745,17 @@ class TraktHub:
                 "\nSome contents may be missing on URL the page."
             )
 
-        loved_percentage, num_of_votes = (
-            parsed_contents.find("div", class_=i).text for i in ("rating", "votes")
-        )
+        # Both are class-bucket probes on the tag index, not tree walks.
+        loved_percentage = tag_index.find("div", class_="rating").text
+        num_of_votes = tag_index.find("div", class_="votes").text
 
-        uncleaned_stats = next(
-            (
-                [
-                    i.get_text(separator="#", strip=True).split("#")
-                    for i in i.find_all("div", class_="number")
-                ]
-                for i in parsed_contents.find_all("ul", class_="stats")
+        uncleaned_stats = [
+            stat.split("#")
+            for stat in map(
+                _GET_TEXT_HASH,
+                tag_index.find("ul", class_="stats").find_all("div", class_="number"),
             )
-        )
+        ]
         space_join = lambda s: " ".join(s)
         imdb_rating, imdb_num_reviews = uncleaned_stats[0]
         tmdb_rating, tmdb_num_reviews = uncleaned_stats[1]
@@ -707,159 +772,110 @@ class TraktHub:
             num_favorited,
         ) = map(itemgetter(0), uncleaned_stats[3:])
 
-        uncleaned_metadata = parsed_contents.find("div", class_="col-lg-8 col-md-7")
-        release_date = next((i.span.text for i in uncleaned_metadata if i.span))
+        uncleaned_metadata = tag_index.find("div", class_="col-lg-8 col-md-7")
+        release_date = runtime_in_hours = country = spoiler = description = None
+        _directors, writers, genres, _languages, _studios = {}, [], [], [], []
+        for tag in uncleaned_metadata.find_all(True):
+            name, itemprop = tag.name, tag.get("itemprop")
+            classes = tag.get("class", ())
+            if name == "span":
+                if release_date is None:
+                    release_date = tag.text
+                if runtime_in_hours is None and "humanized-minutes" in classes:
+                    runtime_in_hours = tag.text
+                elif itemprop == "genre":
+                    genres.append(tag.text)
+                elif "hidden" in classes and itemprop != "writer":
+                    _directors[tag.meta["content"]] = None
+            elif name == "li":
+                if country is None and itemprop == "countryOfOrigin":
+                    country = tag.text.removeprefix("Country")
+                elif (li_label := tag.get_text(strip=True)).startswith("Languages"):
+                    # Values keep 'tag.text' spacing; 'Studios' slices on it below.
+                    _languages.append(tag.text.removeprefix("Languages"))
+                elif li_label.startswith("Studios"):
+                    _studios.append(tag.text.removeprefix("Studios"))
+            elif name == "div":
+                if spoiler is None and tag.get("id") == "tagline":
+                    spoiler = tag.text
+                elif description is None and "readmore" in classes:
+                    description = tag.text
+            if itemprop == "writer":
+                writers.append(tag.meta["content"])
+
         _years_ago = get_datetime().year - int(release_date[:4])
         years_ago = "{ya} year{s} ago".format(
             ya=_years_ago, s="s" if _years_ago != 1 else ""
         )
 
         # Runtime
-        runtime_in_hours = next(
-            (
-                _i.text
-                for i in uncleaned_metadata
-                if (_i := i.find("span", class_="humanized-minutes"))
-            )
-        )
-        _time_match = re.match(r"(?:(\d+)h)?\s*(?:(\d+)m)?", runtime_in_hours)
-        if _time_match:
-            hours = int(_time_match.group(1) or 0)
-            minutes = int(_time_match.group(2) or 0)
+        # Example: '2h 28m', '2h' or '28m'
+        hours, _, minutes = runtime_in_hours.replace(" ", "").rpartition("h")
+        hours, minutes = int(hours or 0), int(minutes.removesuffix("m") or 0)
 
         runtime_in_minutes = f"{(hours * 60) + minutes}m"
 
-        directors = next(
-            (
-                list(
-                    set(i.meta["content"] for i in i.find_all("span", class_="hidden"))
-                )
-                for i in uncleaned_metadata
-                if i.find("span", class_="hidden")
-            )
-        )
+        # Order-preserving dedup, so the first credited director is listed first.
+        directors = list(_directors)
         director = directors[0]
-        writers = next(
-            (
-                [i.meta["content"] for i in i.find_all(itemprop="writer")]
-                for i in uncleaned_metadata
-                if i.find("span", class_="hidden", itemprop="writer")
-            )
-        )
-
-        country = next(
-            (
-                removefix(i.text, "Country", post=False)
-                for i in uncleaned_metadata.find_all("li", itemprop="countryOfOrigin")
-            )
-        )
 
-        _languages = next(
-            (
-                [
-                    removefix(i.text, "Languages", post=False)
-                    for i in i.find_all("li")
-                    if "Languages" in str(i)
-                ]
-                for i in uncleaned_metadata
-                if i.find("li", itemprop="countryOfOrigin")
-            )
-        )[0].split(",")
+        _languages = _languages[0].split(",")
         languages = _languages[0] if len(_languages) == 1 else tuple(_languages)
 
-        _studios = next(
-            (
-                [
-                    removefix(i.text, "Studios", post=False)
-                    for i in i.find_all("li")
-                    if "Studios" in str(i)
-                ]
-                for i in uncleaned_metadata
-                if i.find("li", itemprop="countryOfOrigin")
-            )
-        )
         studios = [
             i[: i.find("+") - 1].strip() if "+" in i else i.strip()
             for i in "".join(_studios).split(",")
         ]
-        genres = [i.text for i in uncleaned_metadata.find_all("span", itemprop="genre")]
-        spoiler, description = next(
-            (
-                [
-                    i.find("div", id="tagline").text,
-                    i.find("div", class_="readmore").text,
-                ]
-                for i in uncleaned_metadata.find_all(
-                    "div", {"data-spoiler-movie-id": True}
-                )
-            )
-        )
-        _actors_table = [
-            [i.find(class_=j).text for j in ("name", "character")]
-            for i in parsed_contents.find_all("li", itemprop="actor")
-        ]
-        actors_table = tuple(i + f" [{j}]" for i, j in _actors_table)
-
-        organized_data = OrderedDict(
-            {
-                "Basic Info": OrderedDict(
-                    {
-                        "Title": flix_title,
-                        "Release Year": release_year,
-                        "Content Rating": flix_mature_rating,
-                    }
-                ),
-                "Ratings": OrderedDict(
-                    {
-                        "Loved %": (loved_percentage, num_of_votes),
-                        "IMDb": (imdb_rating, imdb_num_reviews),
-                        "TMDb": (tmdb_rating, tmdb_num_reviews),
-                        "Rotten Tomatoe": rotten_rating,
-                        "Metacritic": metacritic_rating,
-                        "Audience %": audience_percent,
-                    }
-                ),
-                "Total Engagement": OrderedDict(
-                    {
-                        "Watchers": num_watchers,
-                        "Plays": num_plays,
-                        "Collected": num_collected,
-                        "Comments": num_comments,
-                        "Personal Lists": num_lists,
-                        "Favorited": num_favorited,
-                    }
-                ),
-                "Release Details": OrderedDict(
-                    {
-                        "Release Date": (release_date, years_ago),
-                        "Runtime": (runtime_in_hours, runtime_in_minutes),
-                    }
-                ),
-                "Production": OrderedDict(
-                    {
-                        "Country": country,
-                        "Languages": languages,
-                        "Studios": studios,
-                        "Genres": genres,
-                        "Director": director,
-                        "Directors": directors,
-                        "Writers": writers,
-                    }
-                ),
-                "Narrative": OrderedDict(
-                    {
-                        "Spoiler": spoiler,
-                        "Description": description,
-                    }
-                ),
-                "Cast": OrderedDict(
-                    {
-                        "Actors": actors_table,
-                    }
-                ),
-            }
+        actors_table = tuple(
+            f"{li.find(class_='name').text} [{li.find(class_='character').text}]"
+            for li in tag_index.iter_all("li")
+            if li.get("itemprop") == "actor"
         )
 
+        organized_data = {
+            "Basic Info": {
+                "Title": flix_title,
+                "Release Year": release_year,
+                "Content Rating": flix_mature_rating,
+            },
+            "Ratings": {
+                "Loved %": (loved_percentage, num_of_votes),
+                "IMDb": (imdb_rating, imdb_num_reviews),
+                "TMDb": (tmdb_rating, tmdb_num_reviews),
+                "Rotten Tomatoe": rotten_rating,
+                "Metacritic": metacritic_rating,
+                "Audience %": audience_percent,
+            },
+            "Total Engagement": {
+                "Watchers": num_watchers,
+                "Plays": num_plays,
+                "Collected": num_collected,
+                "Comments": num_comments,
+                "Personal Lists": num_lists,
+                "Favorited": num_favorited,
+            },
+            "Release Details": {
+                "Release Date": (release_date, years_ago),
+                "Runtime": (runtime_in_hours, runtime_in_minutes),
+            },
+            "Production": {
+                "Country": country,
+                "Languages": languages,
+                "Studios": studios,
+                "Genres": genres,
+                "Director": director,
+                "Directors": directors,
+                "Writers": writers,
+            },
+            "Narrative": {
+                "Spoiler": spoiler,
+                "Description": description,
+            },
+            "Cast": {
+                "Actors": actors_table,
+            },
+        }
+
         return organized_data
 
 
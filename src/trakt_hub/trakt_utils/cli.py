@@ -1,4 +1,5 @@
 from argparse import ArgumentParser
+from functools import lru_cache
 
 from .parsers import _metadata_parser
 from ..trakt_functions.functions import (
@@ -12,8 +13,26 @@ from ..trakt_functions.functions import (
     trakt_query,
 )
 
+_METADATA_ARGS = ("version", "author", "license", "description", "url")
 
-def cli_parser():
+# command -> (function, flag selecting 'shows' over the default 'movies')
+_GET_COMMANDS = {
+    "get-boxoffice": (get_boxoffice, None),
+    "get-trending": (get_trending, "tshows"),
+    "get-popular": (get_popular, "pshows"),
+    "get-anticipated": (get_anticipated, "ashows"),
+}
+
+_IS_COMMANDS = {
+    "is-trending": is_trending,
+    "is-popular": is_popular,
+    "is-anticipated": is_anticipated,
+}
+
+
+@lru_cache(maxsize=None)
+def _build_parser():
+    # Built once per process and reused by every `cli_parser` call.
     arg_parser = ArgumentParser(
         description="A CLI for parsing and viewing Trakt-TV data."
     )
@@ -21,7 +40,7 @@ def cli_parser():
 
     def _add_args(parser):
         def wrapper(*args, **kwargs):
-            if all(("action" not in kwargs, all(s.startswith("--") for s in args))):
+            if "action" not in kwargs and all(s.startswith("--") for s in args):
                 kwargs["action"] = "store_true"
             else:
                 kwargs["type"] = str
@@ -101,9 +120,11 @@ def cli_parser():
         "-c", "--category", help="Specify the category of the show or movie."
     )
 
-    metadata = _metadata_parser()
+    return arg_parser
+
 
-    args = arg_parser.parse_args()
+def cli_parser(argv=None):
+    args = _build_parser().parse_args(argv)
 
     def mult_args(func):
         q, c = map(
@@ -113,40 +134,18 @@ def cli_parser():
         return func(query=q, category=c)
 
     # Main-Arguments
-    if args.version:
-        return metadata["version"]
-    elif args.author:
-        return metadata["author"]
-    elif args.license:
-        return metadata["license"]
-    elif args.description:
-        return metadata["description"]
-    elif args.url:
-        return metadata["url"]
+    metadata_arg = next((a for a in _METADATA_ARGS if getattr(args, a)), None)
+    if metadata_arg:
+        return _metadata_parser()[metadata_arg]
 
     # 'get_<category>' function Arguments
-    elif args.command == "get-boxoffice":
-        return get_boxoffice("movies")
-    elif args.command == "get-trending":
-        if args.tshows:
-            return get_trending("shows")
-        return get_trending("movies")
-    elif args.command == "get-popular":
-        if args.pshows:
-            return get_popular("shows")
-        return get_popular("movies")
-    elif args.command == "get-anticipated":
-        if args.ashows:
-            return get_anticipated("shows")
-        return get_anticipated("movies")
+    if args.command in _GET_COMMANDS:
+        func, shows_flag = _GET_COMMANDS[args.command]
+        return func("shows" if shows_flag and getattr(args, shows_flag) else "movies")
 
     # 'is_<category>' function Arguments
-    elif args.command == "is-trending":
-        return mult_args(is_trending)
-    elif args.command == "is-popular":
-        return mult_args(is_popular)
-    elif args.command == "is-anticipated":
-        return mult_args(is_anticipated)
+    if args.command in _IS_COMMANDS:
+        return mult_args(_IS_COMMANDS[args.command])
 
     # Main Query for TraktHub
     return mult_args(trakt_query)
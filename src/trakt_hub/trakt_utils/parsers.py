@@ -1,19 +1,19 @@
 import asyncio
 import tomllib
-from aiohttp import ClientSession, TCPConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.client_exceptions import (
     ClientConnectionError,
     ClientResponseError,
     ContentTypeError,
     InvalidURL,
-    ServerDisconnectedError,
 )
-from async_lru import alru_cache
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
+from weakref import WeakKeyDictionary
 
 
 from .exceptions import (
@@ -26,6 +26,14 @@ from .type_hints import Optional, Union, PathLike
 from .utils import clean_url, soupify, popkwargs, validate_path
 
 
+@lru_cache(maxsize=32)
+def _parse_toml(fp: Path, mtime_ns: int):
+    # Shared by every 'ConfigFileParser' reading the same resolved file;
+    # 'mtime_ns' is only part of the key, so an edited file is parsed again.
+    with open(fp, "rb") as f:
+        return tomllib.load(f)
+
+
 @dataclass(unsafe_hash=True)
 class ConfigFileParser:
     """
@@ -94,7 +102,7 @@ class ConfigFileParser:
         self._config_file_path = fp
 
         try:
-            config_p = tomllib.load(open(fp, "rb"))
+            config_p = _parse_toml(fp, fp.stat().st_mtime_ns)
         except Exception as e:
             raise ParserException(
                 f"There was an error parsing the config file {fp!r}." f"\n{e}"
@@ -156,11 +164,17 @@ class APIParser:
     rapid_api: Optional[bool] = field(default=False, repr=False, kw_only=True)
     headers: Optional[dict[str, str]] = field(default_factory=dict, kw_only=True)
 
-    _host: str = field(init=False, repr=False, default=None)
     _soupify = staticmethod(soupify)
+    # Superset of every tag 'TraktHub' and 'TraktHubViewer' look up.
+    _html_strainer = SoupStrainer(["div", "a", "ul", "li", "span", "h1", "h4", "meta"])
+    # Requests running concurrently on an event loop share one pooled session.
+    # Maps each loop to its [session, active request count].
+    _sessions = WeakKeyDictionary()
+    # Connection errors and timeouts are retried with exponential backoff (0.1s, 0.2s, ...).
+    _max_retries = 5
 
     def __post_init__(self):
-        self.url, self.api_key, self.headers, self._host = self._validate_args()
+        self.url, self.api_key, self.headers = self._validate_args()
         self._contents = None
 
     @classmethod
@@ -171,21 +185,24 @@ class APIParser:
             url = "/".join((url.rstrip("/"), endpoint))
 
         try:
-            async with ClientSession(
-                connector=TCPConnector(
-                    ssl=False,
-                    enable_cleanup_closed=True,
-                    force_close=True,
-                    ttl_dns_cache=300,
-                ),
-                raise_for_status=True,
-            ) as session:
-                async with session.get(url, headers=headers) as response:
-                    return await cls._url_contents(response, _json)
+            async with cls._shared_session() as session:
+                for attempt in range(cls._max_retries):
+                    try:
+                        async with session.get(url, headers=headers) as response:
+                            contents = await (
+                                response.json() if _json else response.text()
+                            )
+                        break
+                    except (ClientConnectionError, asyncio.TimeoutError):
+                        if attempt + 1 < cls._max_retries:
+                            await asyncio.sleep(0.1 * 2**attempt)
+                else:
+                    raise ConnectionException(
+                        f"Unable to connect to {url!r} after {cls._max_retries} attempts."
+                    )
+            return contents[0] if _json and isinstance(contents, list) else contents
         except (ClientResponseError, ContentTypeError) as ccre:
             raise ccre
-        except (ClientConnectionError, ServerDisconnectedError):
-            return await cls.url_request(url, headers=headers, json_format=_json)
         except InvalidURL:
             raise ConnectionException(
                 f"The specified URL could not be found and is considered invalid.",
@@ -194,13 +211,32 @@ class APIParser:
                 f"E.g 'The Matrix 1999'",
             )
 
-    @staticmethod
-    @alru_cache
-    async def _url_contents(response, json_format=False):
-        contents = await getattr(response, ["text", "json"][bool(json_format)])()
-        return (
-            contents[0] if all((json_format, isinstance(contents, list))) else contents
-        )
+    @classmethod
+    @asynccontextmanager
+    async def _shared_session(cls):
+        loop = asyncio.get_running_loop()
+        entry = cls._sessions.get(loop)
+        if entry is None:
+            session = ClientSession(
+                connector=TCPConnector(
+                    ssl=False,
+                    enable_cleanup_closed=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                raise_for_status=True,
+                timeout=ClientTimeout(total=30),
+            )
+            entry = cls._sessions[loop] = [session, 0]
+        entry[1] += 1
+        try:
+            yield entry[0]
+        finally:
+            entry[1] -= 1
+            # The last request on this loop closes the session.
+            if not entry[1]:
+                del cls._sessions[loop]
+                await entry[0].close()
 
     def main_request(self, **kwargs):
         try:
@@ -215,12 +251,37 @@ class APIParser:
         return url_contents
 
     @classmethod
-    def parse_html_contents(cls, html_contents=None):
-        if any((html_contents is None, isinstance(html_contents, BeautifulSoup))):
+    async def _fetch_many(cls, parsers):
+        # Requests every parser's URL concurrently and stores the result on each parser.
+        try:
+            contents = await asyncio.gather(
+                *(
+                    cls.url_request(
+                        p.url, p.endpoint, json_format=p.json_format, headers=p.headers
+                    )
+                    for p in parsers
+                )
+            )
+        except ClientResponseError as cre:
+            raise ConnectionException(
+                f"An error occured while trying to find one of {[p.url for p in parsers]!r}."
+                f"\n[Original Error]: {cre}"
+            )
+        for parser, parser_contents in zip(parsers, contents):
+            parser._contents = parser_contents
+        return contents
+
+    @classmethod
+    def parse_html_contents(
+        cls, html_contents=None, parse_only: Union[SoupStrainer, dict] = None
+    ):
+        if html_contents is None or isinstance(html_contents, BeautifulSoup):
             raise ParserException(
                 f"The provided contents cannot be {None!r} nor an instance of {BeautifulSoup!r}."
             )
-        return cls._soupify(html_contents)
+        if parse_only is None:
+            parse_only = cls._html_strainer
+        return cls._soupify(html_contents, parse_only=parse_only)
 
     @staticmethod
     @cache
@@ -228,21 +289,26 @@ class APIParser:
         return {"x-rapidapi-key": api_key, "x-rapidapi-host": host}
 
     def _validate_args(self):
-        url_and_apikey = self.url, self.api_key
+        url, api_key = self.url, self.api_key
         headers = self.headers
-        host = clean_url(url_and_apikey[0])
+        # Also validates the URL ('clean_url' raises for one without a netloc).
+        host = self._host
 
-        if all((*url_and_apikey,)):
-            if not any((*map(lambda x: isinstance(x, str), url_and_apikey),)):
+        if url and api_key:
+            if not (isinstance(url, str) and isinstance(api_key, str)):
                 raise ParserException(
                     f"Both the endpoint and api-key must be strings and cannot be empty."
                 )
 
         if self.rapid_api:
             self.json_format = True
-            headers = self.rapidapi_headers(url_and_apikey[1], host)
+            headers = self.rapidapi_headers(api_key, host)
+
+        return url, api_key, headers
 
-        return *url_and_apikey, headers, host
+    @cached_property
+    def _host(self):
+        return clean_url(self.url)
 
     @cached_property
     def contents(self):
@@ -1,46 +1,164 @@
+import asyncio
 import calendar
+import re
 import shutil
-from bs4 import BeautifulSoup
+import warnings
+from collections import defaultdict
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime as dt
-from functools import partial
+from functools import lru_cache, partial
+from itertools import chain, count
+from operator import ge, le
 from pathlib import Path
 from urllib.parse import urlparse
 from rapidfuzz import fuzz, process
 
 from .exceptions import ExecutorException, FileException, ParserException, THException
-from .type_hints import Any, Callable, Iterable, PathLike
+from .type_hints import Callable, Iterable, PathLike, Union
 
 
 def validate_path(file_path: PathLike, is_file: bool = False):
     try:
-        fp = Path(file_path).resolve()
+        fp = Path(file_path)
     except TypeError:
         raise FileException(
             f"The provided file path {file_path!r} is not a valid path and must be a string or a Path object."
         )
+    # Only absolute paths resolve the same way regardless of the working directory.
+    fp = _resolve_absolute(fp) if fp.is_absolute() else fp.resolve()
     if is_file and not fp.is_file():
         raise FileException(
             f"The provided file path \033[33m{fp!r}\033[0m is not a valid file path and must be a file."
             "\nOtherwise, disable the 'is_file' argument."
         )
-    elif not any((fp.is_absolute(), fp.exists())):
+    elif not fp.is_absolute() and not fp.exists():
         raise FileException(
             f"The provided file path \033[33m{fp!r}\033[0m is not a valid path and must be an existing path."
         )
     return fp
 
 
+@lru_cache(maxsize=64)
+def _resolve_absolute(fp: Path):
+    return fp.resolve()
+
+
+_NETLOC_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.\-]*://([^/?#]+)")
+
+
+@lru_cache(maxsize=1024)
 def clean_url(url: str):
+    if match := _NETLOC_RE.match(url):
+        return match.group(1)
+    # e.g. scheme-relative URLs ('//trakt.tv/...') that the pattern does not cover.
     url_only = urlparse(url).netloc
     if not url_only:
         raise ParserException(f"The provided URL {url!r} is not a valid URL.")
     return url_only
 
 
-def best_match(s: str, value: Iterable[str], extract_single: bool = True, **kwargs):
-    pe = getattr(process, "extract" if not extract_single else "extractOne")
-    return pe(s.lower(), (i.lower() for i in value), scorer=fuzz.ratio, **kwargs)
+def best_match(
+    s: str,
+    value: Iterable[str],
+    extract_single: bool = True,
+    lru: bool = True,
+    **kwargs,
+):
+    # A tuple (not a generator) keeps rapidfuzz on its C scan over the choices.
+    # 'lru=False' skips the cache for transient, one-off choice lists.
+    kwargs_key = tuple(kwargs.items())
+    if lru:
+        try:
+            hash(kwargs_key)
+        except TypeError:
+            # e.g. a dict passed as 'scorer_kwargs' can't be part of the cache key.
+            lru = False
+    if not lru:
+        choices = tuple(map(str.lower, value))
+        return _best_match(s.lower(), choices, extract_single, **kwargs)
+    choices = _lower_choices(tuple(value))
+    match = _best_match_cached(s.lower(), choices, extract_single, kwargs_key)
+    return match if extract_single else list(match)
+
+
+@lru_cache(maxsize=32)
+def _lower_choices(choices: tuple):
+    # Repeat queries against the same catalog reuse one lowercased copy.
+    return tuple(map(str.lower, choices))
+
+
+# Indexed by 'extract_single'.
+_PROCESS_FNS = (process.extract, process.extractOne)
+
+
+def _best_match(s: str, choices: tuple, extract_single: bool, **kwargs):
+    pe = _PROCESS_FNS[bool(extract_single)]
+    # Choices are already lowercased, so rapidfuzz's own processor is skipped unless asked for.
+    kwargs.setdefault("processor", None)
+    return pe(s, choices, scorer=fuzz.ratio, **kwargs)
+
+
+@lru_cache(maxsize=4096)
+def _best_match_cached(s: str, choices: tuple, extract_single: bool, kwargs: tuple):
+    match = _best_match(s, choices, extract_single, **dict(kwargs))
+    # Cached results are shared, so multi-result lists are frozen.
+    return match if extract_single else tuple(match)
+
+
+def _lower_queries(queries: Iterable[str]):
+    if isinstance(queries, str):
+        # A string would otherwise be scored one character at a time.
+        raise THException(
+            f"An iterable of queries is required, not a single string ({queries!r})."
+        )
+    return tuple(map(str.lower, queries))
+
+
+def best_matches(
+    queries: Iterable[str],
+    choices: Iterable[str],
+    scorer: Callable = fuzz.ratio,
+    score_cutoff: int = None,
+    lower_is_better: bool = False,
+):
+    # One (queries x choices) score matrix instead of an 'extractOne' scan per query.
+    # Each query maps to its best (choice, score, index), or None past 'score_cutoff'.
+    # Pass 'lower_is_better=True' with a distance scorer (e.g. 'Levenshtein.distance').
+    queries = _lower_queries(queries)
+    choices = tuple(choices)
+    if not queries or not choices:
+        return [None] * len(queries)
+    scores = process.cdist(
+        queries,
+        _lower_choices(choices),
+        scorer=scorer,
+        processor=None,
+        score_cutoff=score_cutoff,
+        # float64 keeps similarity scores identical to 'extractOne' (cdist defaults to float32).
+        dtype=None if lower_is_better else float,
+        workers=-1,
+    )
+    if lower_is_better:
+        best_idxs, best_scores, within_cutoff = (
+            scores.argmin(axis=1),
+            scores.min(axis=1),
+            le,
+        )
+    else:
+        best_idxs, best_scores, within_cutoff = (
+            scores.argmax(axis=1),
+            scores.max(axis=1),
+            ge,
+        )
+    return [
+        (
+            (choices[idx], score, idx)
+            if score_cutoff is None or within_cutoff(score, score_cutoff)
+            else None
+        )
+        for idx, score in zip(best_idxs.tolist(), best_scores.tolist())
+    ]
 
 
 def get_terminal_size(col_or_lines: str = ""):
@@ -48,77 +166,212 @@ def get_terminal_size(col_or_lines: str = ""):
     return getattr(ts, col_or_lines) if col_or_lines else ts
 
 
-def soupify(contents: str, markup: str = "html.parser"):
-    def _soup(*args):
+def _has_class(*tokens: str, match_all: bool = False):
+    # Strainers see the raw class string while parsing, so match on its tokens.
+    # Any token matches by default; 'match_all' requires all of them.
+    wanted = frozenset(tokens)
+
+    def match(value):
+        if value is None:
+            return False
+        if isinstance(value, str):
+            value = value.split()
+        return wanted.issubset(value) if match_all else not wanted.isdisjoint(value)
+
+    return match
+
+
+def soupify(contents: str, markup: str = "lxml", parse_only=None):
+    def _soup(*args, **kwargs):
         try:
-            return BeautifulSoup(*args)
+            return BeautifulSoup(*args, **kwargs)
+        except FeatureNotFound:
+            # The requested parser (lxml by default) is not installed; use the built-in one.
+            return _soup(args[0], "html.parser", **kwargs)
         except KeyError:
             raise ParserException(
                 f"The provided contents {args[0]!r} is not a valid content and must be a string or a file-like object."
             )
 
-    return _soup(contents, markup)
+    if isinstance(parse_only, dict):
+        # e.g. {"name": "div", "class_": "titles"}
+        parse_only = dict(parse_only)
+        if isinstance(class_ := parse_only.get("class_"), str):
+            parse_only["class_"] = _has_class(*class_.split(), match_all=True)
+        parse_only = SoupStrainer(**parse_only)
+    return _soup(contents, markup, parse_only=parse_only)
+
+
+def lxmlify(contents: Union[str, bytes]):
+    # Read-only fast path: a bare lxml tree for 'xpath'/'cssselect' without BeautifulSoup's wrappers.
+    try:
+        from lxml import etree, html as lxml_html
+    except ImportError:
+        raise ParserException(
+            "'lxmlify' requires the 'lxml' package. Use 'soupify' instead or install 'lxml'."
+        )
+    try:
+        return lxml_html.fromstring(contents)
+    except (TypeError, ValueError, etree.ParserError) as e:
+        raise ParserException(
+            f"The provided contents could not be parsed by lxml and must be a non-empty string or bytes.\n{e}"
+        )
+
+
+class _TagIndex:
+    """
+    A lookup table of the tags in a parsed document, keyed by tag name and by class token.
+
+    The document is walked once on creation so repeated `find`/`find_all` calls
+    for the same soup become dictionary probes instead of full-tree walks.
+    """
+
+    __slots__ = ("by_tag", "by_class")
+
+    def __init__(self, soup: BeautifulSoup):
+        self.by_tag = defaultdict(list)
+        self.by_class = defaultdict(list)
+        for tag in soup.find_all(True):
+            self.by_tag[tag.name].append(tag)
+            for token in dict.fromkeys(tag.get("class", ())):
+                self.by_class[token].append(tag)
+
+    def iter_all(self, tag: str, class_: str = None):
+        if class_ is None:
+            return iter(self.by_tag.get(tag, ()))
+        # Multi-class values (e.g. "col-lg-8 col-md-7") must match the full attribute.
+        first_token, *other_tokens = class_.split()
+        return (
+            t
+            for t in self.by_class.get(first_token, ())
+            if t.name == tag and (not other_tokens or " ".join(t["class"]) == class_)
+        )
+
+    def find_all(self, tag: str, class_: str = None):
+        return list(self.iter_all(tag, class_))
+
+    def find(self, tag: str, class_: str = None):
+        return next(self.iter_all(tag, class_), None)
 
 
 def popkwargs(*args, **kwargs):
     df_value = kwargs.pop("default_value", None)
-    return *(kwargs.pop(k, df_value) for k in args), kwargs
+    values = [kwargs.pop(k, df_value) for k in args]
+    values.append(kwargs)
+    return tuple(values)
 
 
 def page_merger(page_contents):
     first_page = next(page_contents)
-    starting_idx = len(first_page) + 1
+    # Rows from the remaining pages continue the numbering of the first page.
+    first_page.update(
+        zip(
+            count(len(first_page) + 1),
+            chain.from_iterable(page.values() for page in page_contents),
+        )
+    )
+    return first_page
 
-    for page in page_contents:
-        for idx, values in enumerate(page.values(), start=starting_idx):
-            first_page[idx] = values
 
-    return first_page
+# Trakt.tv listings are always scraped as pages 1-5.
+_PAGES = (1, 2, 3, 4, 5)
 
 
-def page_executor(
+async def apage_executor(
     thub: Callable, category: str, func_type: str, merge_pages: bool = True
 ):
     # func_type -> Any of of the 'Get' functions
-    thub_func = lambda pg: thub(category=category, page_number=pg).track_hub(func_type)
-    page_contents = executor(thub_func, range(1, 6))
+    # All pages are tracked concurrently on a single event loop.
+    page_contents = await asyncio.gather(
+        *(
+            thub(category=category, page_number=pg).atrack_hub(func_type)
+            for pg in _PAGES
+        )
+    )
     if merge_pages:
-        return page_merger(page_contents)
+        return page_merger(iter(page_contents))
     return page_contents
 
 
+def page_executor(
+    thub: Callable, category: str, func_type: str, merge_pages: bool = True
+):
+    coro = apage_executor(thub, category, func_type, merge_pages)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside a running loop (e.g. Jupyter or an async app),
+    # so the pages are fetched on a worker thread with its own loop.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
 def removefix(_string, obj, *, post: bool = True):
-    return getattr(_string, "removesuffix" if post else "removeprefix")(obj)
+    return _string.removesuffix(obj) if post else _string.removeprefix(obj)
+
+
+# The 'ppex' pool is for CPU-bound pure-Python work only.
+# These run in C (lxml, rapidfuzz) or wait on I/O, so pickling them to processes only adds overhead.
+_POOLS = {"ppex": ProcessPoolExecutor}
+# Matched by identity, so user functions sharing one of these names are unaffected.
+_FORCE_THREADS_FOR = frozenset((soupify, best_match, best_matches, page_executor))
 
 
 def executor(func: Callable, *args, **kwargs):
+    # Public helper for callers' own fanout; the package itself fetches pages via 'page_executor'.
+    # Remaining kwargs go to 'Executor.map' (e.g. 'chunksize' for the 'ppex' pool).
     max_w, epool, kwargs = popkwargs("max_workers", "epool", **kwargs)
-    maxw_p = lambda p: partial(p, max_workers=max_w)
-    if all((max_w is not None, not isinstance(max_w, int))):
+    if max_w is not None and not isinstance(max_w, int):
         raise ExecutorException(
             f"The provided {max_w = !r} is not a valid argument and must be {None!r} or a positive integer."
         )
-    _exec = list(map(maxw_p, (ThreadPoolExecutor, ProcessPoolExecutor)))[
-        epool == "ppex"
-    ]
-    yield from _exec().map(func, *args, **kwargs)
+    if epool == "ppex" and any(func is f for f in _FORCE_THREADS_FOR):
+        warnings.warn(
+            f"{func.__name__!r} does not benefit from a process pool; using threads instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        epool = None
+    # The pool is shut down once its results have been consumed.
+    with _POOLS.get(epool, ThreadPoolExecutor)(max_workers=max_w) as pool:
+        yield from pool.map(func, *args, **kwargs)
+
+
+async def _gather(coro_func: Callable, *iterables, limit: int = 32):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(args):
+        async with semaphore:
+            return await coro_func(*args)
+
+    return await asyncio.gather(*(_bounded(args) for args in zip(*iterables)))
+
+
+def async_executor(coro_func: Callable, *iterables):
+    # I/O fanout (e.g. 'APIParser.url_request') on one event loop, at most 32 in flight.
+    # 'executor' remains for CPU-bound work.
+    return asyncio.run(_gather(coro_func, *iterables))
+
+
+@lru_cache(maxsize=None)
+def _month_length(year: int, month: int):
+    return calendar.monthrange(year, month)[1]
 
 
 def get_datetime(increment_day: int = 0, with_time: bool = False):
     _dt = dt.now()
-    date, day = _dt.date(), _dt.day
-    try:
-        if not with_time:
-            return date.replace(day=day + increment_day)
+    if with_time:
         return _dt.strftime("%m/%d/%Y %I:%M %p")
-    except ValueError:
+    new_day = _dt.day + increment_day
+    month_range = _month_length(_dt.year, _dt.month)
+    if not 1 <= new_day <= month_range:
         # For cases above 31 days
-        month = calendar.month_name[date.month]
-        month_range = calendar.monthrange(date.year, date.month)[1]
+        month = calendar.month_name[_dt.month]
         raise THException(
             f"Cannot increment the day by {increment_day} as it exceeds the month of {month} which has {month_range} days."
         )
+    return _dt.date().replace(day=new_day)
 
 
-def enumerate_at_one(obj: Any):
-    return enumerate(obj, start=1)
+enumerate_at_one = partial(enumerate, start=1)
@@ -0,0 +1,135 @@
+import unittest
+
+from trakt_hub import (
+    TraktHub,
+    are_popular,
+    are_trending,
+    get_trending,
+    is_popular,
+    is_trending,
+)
+from trakt_hub.trakt_utils.parsers import APIParser
+
+
+def _listing_rows(section: str, page: str):
+    # Three valid rows per page ('Title <page> <row>'), then rows the parsers skip.
+    rows = []
+    for n, suffix in enumerate("XYZ", start=1):
+        title = f"Title {'ABCDE'[int(page) - 1]} {suffix} 20{10 + n}"
+        if section == "trending":
+            rows.append(f"<h4>{n * 10} people watching</h4><h3>{title}</h3>")
+        elif section == "popular":
+            rows.append(f"<h3>{title}</h3>")
+        elif section == "boxoffice":
+            rows.append(f"<h4>${n},000,000</h4><h3>{title}</h3>")
+    rows.append("<h3>No year on this row</h3>")
+    if section != "popular":
+        rows.append("<h4>not a count</h4><h3>Bad Count Row 2020</h3>")
+    rows = "".join(f'<div class="titles">{row}</div>' for row in rows)
+    other = '<div class="other"><h3>Ignored 2020</h3></div>'
+    return f"<html><body>{rows}{other}</body></html>"
+
+
+class _StubbedRequests(unittest.TestCase):
+    """Serves synthetic listing pages instead of requesting Trakt.tv."""
+
+    def setUp(self):
+        self.requests = []
+        self._url_request = APIParser.__dict__["url_request"]
+
+        async def url_request(cls, url, endpoint="", **kwargs):
+            self.requests.append((url, endpoint))
+            section, _, page = endpoint.partition("?page=")
+            return _listing_rows(section, page or "1")
+
+        APIParser.url_request = classmethod(url_request)
+        get_trending.cache_clear()
+
+    def tearDown(self):
+        APIParser.url_request = self._url_request
+        get_trending.cache_clear()
+
+
+class TestListingRows(_StubbedRequests):
+    def test_trending_rows(self):
+        rows = TraktHub(category="movies").track_hub("trending")
+        self.assertEqual(
+            rows,
+            {
+                1: {"Title": "Title A X", "Watch Count": 10, "Year": 2011},
+                2: {"Title": "Title A Y", "Watch Count": 20, "Year": 2012},
+                3: {"Title": "Title A Z", "Watch Count": 30, "Year": 2013},
+            },
+        )
+
+    def test_popular_rows(self):
+        rows = TraktHub(category="shows").track_hub("popular")
+        self.assertEqual(
+            [row["Title"] for row in rows.values()],
+            ["Title A X", "Title A Y", "Title A Z"],
+        )
+        self.assertEqual([row["Year"] for row in rows.values()], [2011, 2012, 2013])
+
+    def test_boxoffice_rows(self):
+        rows = TraktHub(category="movies").track_hub("boxoffice")
+        self.assertEqual(
+            [(row["Title"], row["Total Budget"]) for row in rows.values()],
+            [
+                ("Title A X", "$1,000,000"),
+                ("Title A Y", "$2,000,000"),
+                ("Title A Z", "$3,000,000"),
+            ],
+        )
+
+    def test_unmatched_rows_are_skipped(self):
+        for section in ("trending", "popular", "boxoffice"):
+            rows = TraktHub(category="movies").track_hub(section)
+            self.assertEqual(len(rows), 3, section)
+            for row in rows.values():
+                self.assertRegex(row["Title"], r"^Title A [XYZ]$")
+
+
+class TestPageCache(_StubbedRequests):
+    def test_pages_are_fetched_once(self):
+        first = get_trending("movies")
+        self.assertEqual(len(self.requests), 5)
+        self.assertEqual(len(first), 15)
+        self.assertEqual(get_trending(category="movies"), first)
+        self.assertEqual(len(self.requests), 5)
+
+    def test_cache_clear_refetches(self):
+        get_trending("movies")
+        get_trending.cache_clear()
+        get_trending("movies")
+        self.assertEqual(len(self.requests), 10)
+
+    def test_callers_get_copies(self):
+        first = get_trending("movies")
+        first[1]["Title"] = "Changed"
+        del first[2]
+        second = get_trending("movies")
+        self.assertIsNot(first, second)
+        self.assertEqual(second[1]["Title"], "Title A X")
+        self.assertIn(2, second)
+
+
+class TestIsAreAgreement(_StubbedRequests):
+    queries = ["Title A X", "title c z", "Title E Y", "Title F X", "Something Else"]
+
+    def test_are_trending_matches_is_trending(self):
+        expected = [is_trending(q, "movies") for q in self.queries]
+        self.assertEqual(expected, [True, True, True, False, False])
+        self.assertEqual(are_trending(self.queries, "movies"), expected)
+
+    def test_are_popular_matches_is_popular(self):
+        expected = [is_popular(q, "shows") for q in self.queries]
+        self.assertEqual(are_popular(self.queries, "shows"), expected)
+
+    def test_empty_queries(self):
+        self.assertIs(is_trending("", "movies"), False)
+        self.assertEqual(are_trending([], "movies"), [])
+        self.assertEqual(self.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()